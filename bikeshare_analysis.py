@@ -1,4 +1,8 @@
+import os
 import time
+import functools
+import importlib.util
+import tempfile
 import pandas as pd
 import numpy as np
 import calendar
@@ -13,6 +17,52 @@ CITY_DATA = {
 MONTHS = ['all'] + [month.lower() for month in calendar.month_name[1:7]]
 DAYS = ['all'] + [day.lower() for day in calendar.day_name]
 
+# Built once at import time for constant-time index lookup
+MONTH_INDEX = {month: i for i, month in enumerate(MONTHS)}
+DAY_INDEX = {day: i for i, day in enumerate(DAYS)}
+
+# Accepted user input mapped to canonical filter values, so validation is one dict lookup
+CITY_ALIASES = {
+    'chicago': 'chicago',
+    'chi': 'chicago',
+    'new york city': 'new york city',
+    'new york': 'new york city',
+    'nyc': 'new york city',
+    'ny': 'new york city',
+    'washington': 'washington',
+    'dc': 'washington'
+}
+MONTH_ALIASES = {alias: month for month in MONTHS for alias in (month, month[:3])}
+DAY_ALIASES = {alias: day for day in DAYS for alias in (day, day[:3])}
+
+# Columns read from every city file; Washington has no demographic columns
+CSV_COLUMNS = ['Start Time', 'End Time', 'Trip Duration', 'Start Station', 'End Station', 'User Type']
+CITY_EXTRA_COLUMNS = {
+    'chicago': ['Gender', 'Birth Year'],
+    'new york city': ['Gender', 'Birth Year'],
+    'washington': []
+}
+
+# Predeclared dtypes so read_csv skips type inference on every load
+COLUMN_DTYPES = {
+    'End Time': 'str',
+    'Start Station': 'category',
+    'End Station': 'category',
+    'User Type': 'category',
+    'Gender': 'category',
+    'Trip Duration': 'float64',
+    'Birth Year': 'float32'
+}
+
+# Rows per chunk when streaming a file for a filtered load
+CSV_CHUNK_SIZE = 200_000
+
+# pyarrow is optional; it enables the fast CSV engine, the Feather copy, and Parquet export
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Fully parsed DataFrames by city, filled by _load_city and shared within the process
+_CITY_CACHE = {}
+
 
 def get_filters():
     """
@@ -23,107 +73,434 @@ def get_filters():
     """
     print('Hello! Let\'s explore some US bikeshare data!')
     # Get user input for city (chicago, new york city, washington).
-def search_by():
-        # Prompts user to specify a city, month, and day to analyze
     while True:
-        city = input("Enter city (Chicago, New York City, Washington): ").casefold()
-        if city in CITY_DATA:
+        city = CITY_ALIASES.get(input("Enter city (Chicago, New York City, Washington): ").strip().lower())
+        if city is not None:
             break
         print("Invalid city. Please try again.")
 
     # Get user input for month (all, january, february, ... , june)
 
     while True:
-        month = input("Enter month (January to June) or 'all': ").strip().lower()
-        if month in MONTHS:
+        month = MONTH_ALIASES.get(input("Enter month (January to June) or 'all': ").strip().lower())
+        if month is not None:
             break
         print("Invalid month. Please try again.")
 
     # Get user input for day of week (all, monday, tuesday, ... sunday)
 
     while True:
-        day = input("Enter day of week or 'all': ").strip().lower()
-        if day in DAYS:
+        day = DAY_ALIASES.get(input("Enter day of week or 'all': ").strip().lower())
+        if day is not None:
             break
         print("Invalid day. Please try again.")
 
-
     print('-'*50)
-    print("-" * 50)
 
     return city, month, day
 
 
-def load_data(city, month, day):
+def _split_start_time(start_time):
+    """
+    Derives month and day of week from Start Time in one pass over its buffer.
+
+    Args:
+        start_time (pandas.Series): Parsed Start Time column.
 
+    Returns:
+        (numpy.ndarray, numpy.ndarray): int8 month (1-12) and day of week
+        (Monday=0) arrays, with -1 where Start Time is missing.
     """
-    Loads data for the specified city and filters by month and day if applicable.
+    values = start_time.values
+    seconds = values.astype('datetime64[s]').view('int64')
+    days = seconds // 86400
+
+    # 1970-01-01 was a Thursday, so shift by 3 to make Monday 0
+    day_of_week = (days + 3) % 7
+    month = days.astype('datetime64[D]').astype('datetime64[M]').view('int64') % 12 + 1
+
+    # NaT views as INT64_MIN, so mark those rows with -1 instead of a made-up date
+    missing = np.isnat(values)
+    month[missing] = -1
+    day_of_week[missing] = -1
+
+    return month.astype(np.int8), day_of_week.astype(np.int8)
+
+
+def _read_city_csv(city, **kwargs):
+    """
+    Calls pandas.read_csv on a city's data file with the predeclared columns and dtypes.
 
     Args:
-        city (str): Name of the city to analyze.
+        city (str): Name of the city to load.
+        **kwargs: Extra keyword arguments passed to pandas.read_csv.
+
+    Returns:
+        pandas.DataFrame or pandas.io.parsers.TextFileReader: The read_csv result.
+    """
+    usecols = CSV_COLUMNS + CITY_EXTRA_COLUMNS[city]
+    return pd.read_csv(CITY_DATA[city], usecols=usecols, dtype=COLUMN_DTYPES,
+                       parse_dates=['Start Time'], cache_dates=True, **kwargs)
+
+
+def _feather_path(city):
+    """
+    Returns the path of the Feather copy kept next to a city's CSV file.
+
+    Args:
+        city (str): Name of the city.
+
+    Returns:
+        str: Path of the Feather file.
+    """
+    return os.path.splitext(CITY_DATA[city])[0] + '.feather'
+
+
+def _has_fresh_feather(city):
+    """
+    Checks whether a city's Feather copy exists and is not older than its CSV file.
+
+    Args:
+        city (str): Name of the city.
+
+    Returns:
+        bool: True if the Feather copy can be used in place of the CSV file.
+    """
+    feather_path = _feather_path(city)
+    return (os.path.exists(feather_path)
+            and os.path.getmtime(feather_path) >= os.path.getmtime(CITY_DATA[city]))
+
+
+def _write_feather(df, feather_path):
+    """
+    Writes a Feather file atomically via a temporary file in the same directory.
+
+    A failed or interrupted write removes the temporary file and never leaves a
+    partial file at feather_path.
+
+    Args:
+        df (pandas.DataFrame): Data to write.
+        feather_path (str): Destination path.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(feather_path) or '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        df.to_feather(tmp_path)
+        os.replace(tmp_path, feather_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _read_city(city):
+    """
+    Reads a city's full data file, preferring the Feather copy written by earlier runs.
+
+    On a cache miss the CSV file is parsed with pyarrow's CSV reader and saved
+    as Feather, so later processes skip CSV parsing. Feather keeps the category
+    and datetime dtypes. If pyarrow is not installed, the CSV file is parsed
+    with the default engine. A Feather copy that cannot be read is replaced,
+    and if the Feather file cannot be written, the parsed result is returned
+    as is.
+
+    Args:
+        city (str): Name of the city to load.
+
+    Returns:
+        pandas.DataFrame: Unfiltered bikeshare data.
+    """
+    if not PYARROW_AVAILABLE:
+        return _read_city_csv(city)
+
+    if _has_fresh_feather(city):
+        # An unreadable copy (e.g., left by an older, non-atomic write) is re-parsed and replaced
+        try:
+            return pd.read_feather(_feather_path(city))
+        except (OSError, ValueError):
+            pass
+
+    # pyarrow's multithreaded parser is several times faster than the default C engine
+    df = _read_city_csv(city, engine='pyarrow')
+    try:
+        _write_feather(df, _feather_path(city))
+    except OSError:
+        pass
+
+    return df
+
+
+def _add_time_columns(df):
+    """
+    Adds month and day_of_week columns derived from Start Time.
+
+    Args:
+        df (pandas.DataFrame): Bikeshare data with a parsed Start Time column.
+
+    The columns are nullable Int8, so rows without a Start Time show as missing
+    in raw data and exports rather than as the internal -1 marker.
+
+    Args:
+        df (pandas.DataFrame): Bikeshare data with a parsed Start Time column.
+
+    Returns:
+        pandas.DataFrame: Bikeshare data with the derived columns appended.
+    """
+    # Hour is derived only where needed
+    month, day_of_week = _split_start_time(df['Start Time'])
+
+    # Append both columns as one Int8 block instead of inserting them one at a time
+    extras = pd.DataFrame({'month': pd.arrays.IntegerArray(month, month < 0),
+                           'day_of_week': pd.arrays.IntegerArray(day_of_week, day_of_week < 0)},
+                          index=df.index)
+    return pd.concat([df, extras], axis=1)
+
+
+def _time_codes(values):
+    """
+    Returns a nullable Int8 time column as an int8 array with -1 for missing values.
+
+    Args:
+        values (pandas.Series): The month or day_of_week column.
+
+    Returns:
+        numpy.ndarray: int8 codes, -1 where the value is missing.
+    """
+    return values.to_numpy(dtype=np.int8, na_value=-1)
+
+
+def _filter_by_time(df, month, day):
+    """
+    Filters by month and day if applicable.
+
+    Args:
+        df (pandas.DataFrame): Bikeshare data with month and day_of_week columns.
         month (str): Name of the month to filter by, or "all" to apply no month filter.
         day (str): Name of the day of week to filter by, or "all" to apply no day filter.
 
     Returns:
         pandas.DataFrame: Filtered bikeshare data.
     """
-    df = pd.read_csv(CITY_DATA[city])
-    df['Start Time'] = pd.to_datetime(df['Start Time'])
-
-    # Extract month, day of week, and hour from Start Time
-    df['month'] = df['Start Time'].dt.month
-    df['day_of_week'] = df['Start Time'].dt.day_name().str.lower()
-    df['hour'] = df['Start Time'].dt.hour
+    # With both filters, pack month and day of week into one int16 code and mask once
+    if month != 'all' and day != 'all':
+        codes = _time_codes(df['month']).astype(np.int16) * 10 + _time_codes(df['day_of_week'])
+        target = MONTH_INDEX[month] * 10 + DAY_INDEX[day] - 1
+        return df[codes == target]
 
     # Filter by month if applicable
     if month != 'all':
         # Use the index of the month name to get the corresponding integer month
-        month_index = MONTHS.index(month)
-        df = df[df['month'] == month_index]
+        month_index = MONTH_INDEX[month]
+        df = df[_time_codes(df['month']) == month_index]
 
     # Filter by day of week if applicable
+    if day != 'all':
+        # DAYS starts with 'all', so shift by one to match dayofweek (Monday=0)
+        day_index = DAY_INDEX[day] - 1
+        df = df[_time_codes(df['day_of_week']) == day_index]
 
-        # Loads data for the specified city and filters by month and day if applicable
-    df = pd.read_csv(CITY_DATA[city])
-    df['Start Time'] = pd.to_datetime(df['Start Time'])
+    return df
 
-    df['month'] = df['Start Time'].dt.month
-    df['day_of_week'] = df['Start Time'].dt.day_name().str.lower()
 
-    if month != 'all':
-        month_index = MONTHS.index(month)
-        df = df[df['month'] == month_index]
+def _load_city(city):
+    """
+    Reads and parses the full data file for a city once per process.
 
- main
-    if day != 'all':
-        df = df[df['day_of_week'] == day]
+    The returned DataFrame is kept in _CITY_CACHE, shared between calls, and
+    must not be modified.
 
-    return df
+    Args:
+        city (str): Name of the city to load.
+
+    Returns:
+        pandas.DataFrame: Unfiltered bikeshare data with month and day_of_week columns.
+    """
+    if city not in _CITY_CACHE:
+        _CITY_CACHE[city] = _add_time_columns(_read_city(city))
+    return _CITY_CACHE[city]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_city_filtered(city, month, day):
+    """
+    Streams a city's data file in chunks, keeping only rows that match the filters.
+
+    Used for filtered loads when pyarrow is not installed. Only the surviving
+    rows of each chunk are kept, so peak memory follows the size of the
+    filtered result rather than the whole file. The returned DataFrame is
+    shared between calls and must not be modified.
+
+    Args:
+        city (str): Name of the city to load.
+        month (str): Name of the month to filter by, or "all" to apply no month filter.
+        day (str): Name of the day of week to filter by, or "all" to apply no day filter.
+
+    Returns:
+        pandas.DataFrame: Filtered bikeshare data.
+    """
+    parts = [_filter_by_time(_add_time_columns(chunk), month, day)
+             for chunk in _read_city_csv(city, chunksize=CSV_CHUNK_SIZE)]
+    df = pd.concat(parts, ignore_index=True)
+
+    # Each chunk builds its own categories, so concat falls back to object columns
+    category_columns = [col for col, dtype in COLUMN_DTYPES.items() if dtype == 'category' and col in df]
+    return df.astype({col: 'category' for col in category_columns})
+
+
+def load_data(city, month, day):
+
+    """
+    Loads data for the specified city and filters by month and day if applicable.
+
+    Args:
+        city (str): Name of the city to analyze.
+        month (str): Name of the month to filter by, or "all" to apply no month filter.
+        day (str): Name of the day of week to filter by, or "all" to apply no day filter.
+
+    Returns:
+        pandas.DataFrame: Filtered bikeshare data.
+    """
+    # Slice the full frame when it is already in memory or pyarrow can read it quickly
+    # (and write the Feather copy); otherwise stream only the matching CSV rows
+    if (month == 'all' and day == 'all') or city in _CITY_CACHE or PYARROW_AVAILABLE:
+        df = _filter_by_time(_load_city(city), month, day)
+    else:
+        df = _load_city_filtered(city, month, day)
+
+    # Copy so callers can modify the result without touching the cached frame
+    return df.copy()
+
+
+def _mode_small(values):
+    """
+    Finds the most common value of a small-range integer array.
+
+    Counting with numpy.bincount avoids the sort and hash work done by Series.mode.
+    Ties resolve to the smallest value, matching Series.mode()[0]. Negative values
+    mark missing entries and are skipped, as Series.mode skips NaN.
+
+    Args:
+        values (numpy.ndarray): Integers, with -1 for missing entries.
+
+    Returns:
+        int: The most common value.
+    """
+    return np.bincount(values[values >= 0]).argmax()
+
+
+def _print_table(columns):
+    """
+    Prints a Markdown table without building a DataFrame or calling tabulate.
+
+    Integer cells are right-aligned and everything else is left-aligned.
+
+    Args:
+        columns (dict): Column headers mapped to equal-length lists of cell values.
+    """
+    headers = list(columns)
+    rows = list(zip(*columns.values()))
+    widths = [max(len(str(cell)) for cell in (header, *cells))
+              for header, cells in zip(headers, columns.values())]
+    numeric = [all(isinstance(cell, (int, np.integer)) for cell in cells) for cells in columns.values()]
+
+    def format_row(cells):
+        return "| " + " | ".join(f"{str(cell):>{width}}" if is_numeric else f"{str(cell):<{width}}"
+                                 for cell, width, is_numeric in zip(cells, widths, numeric)) + " |"
+
+    print(format_row(headers))
+    print("|" + "|".join("-" * (width + 1) + ":" if is_numeric else ":" + "-" * (width + 1)
+                         for width, is_numeric in zip(widths, numeric)) + "|")
+    for row in rows:
+        print(format_row(row))
+
+
+def _category_counts(values):
+    """
+    Counts each category of a categorical Series in one pass over its codes.
+
+    Args:
+        values (pandas.Series): Categorical Series.
+
+    Returns:
+        list of (str, int): Observed categories and their counts, most common first.
+    """
+    codes = values.cat.codes.values
+    counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+    order = np.argsort(-counts, kind='stable')
+    return [(values.cat.categories[i], int(counts[i])) for i in order if counts[i] > 0]
 
 
-def time_stats(df):
+def _compute_all_stats(df):
+    """
+    Computes the time, trip duration, and user type/gender reductions in one place.
+
+    The columns are read as integer-coded NumPy arrays once and reduced with
+    bincounts and a single sum, so time_stats, trip_duration_stats, and
+    user_stats only format the results.
+
+    Args:
+        df (pandas.DataFrame): Filtered bikeshare data.
+
+    Returns:
+        dict: Popular month, day, and hour, total and average trip duration,
+        per-column category counts, and the seconds spent computing them, or
+        None if df is empty.
+    """
+    if df.empty:
+        return None
+    start_time = time.time()
+
+    # Hour is only needed here, so it is not stored on the DataFrame
+    start_times = df['Start Time'].values
+    seconds = start_times.astype('datetime64[s]').view('int64')
+    hours = np.where(np.isnat(start_times), -1, seconds // 3600 % 24).astype(np.int8)
+
+    # Reduce the raw buffer once and derive the mean from the same sum, skipping
+    # missing durations as Series.sum/Series.mean do
+    durations = df['Trip Duration'].values
+    duration_sum = np.nansum(durations)
+    duration_count = np.count_nonzero(~np.isnan(durations))
+
+    return {
+        'popular_month': int(_mode_small(_time_codes(df['month']))),
+        'popular_day': int(_mode_small(_time_codes(df['day_of_week']))),
+        'popular_hour': int(_mode_small(hours)),
+        'total_duration': int(duration_sum),
+        'avg_duration': int(duration_sum / duration_count),
+        # Tally user types and genders from their category codes
+        'counts': {col: _category_counts(df[col]) for col in ('User Type', 'Gender') if col in df.columns},
+        'calculation_time': time.time() - start_time
+    }
+
+
+def time_stats(df, stats=None):
     """
     Displays statistics on the most frequent times of travel.
 
     Args:
         df (pandas.DataFrame): Filtered bikeshare data.
+        stats (dict): Result of _compute_all_stats(df); computed here if omitted.
     """
     print('\n📅 Most Frequent Times of Travel:\n')
-    start_time = time.time()
 
     if df.empty:
         print("No data available for the selected filters to calculate time statistics.")
         return
 
-    popular_month = int(df['month'].mode()[0])
-    popular_day = df['day_of_week'].mode()[0].title()
-    popular_hour = int(df['hour'].mode()[0])
+    if stats is None:
+        stats = _compute_all_stats(df)
+    # Count the shared computation in this section's reported time
+    start_time = time.time() - stats['calculation_time']
+
+    popular_month = stats['popular_month']
+    popular_day = calendar.day_name[stats['popular_day']]
+    popular_hour = stats['popular_hour']
 
     data = {
         "Statistic": ["Most Popular Month", "Most Popular Day", "Most Popular Start Hour"],
         "Value": [calendar.month_name[popular_month], popular_day, f"{popular_hour}:00"]
     }
-    print(pd.DataFrame(data).to_markdown(index=False))
+    _print_table(data)
     print(f"\n(Calculated in {time.time() - start_time:.2f} seconds)")
     print('-'*50)
 
@@ -142,42 +519,55 @@ def station_stats(df):
         print("No data available for the selected filters to calculate station statistics.")
         return
 
-    popular_start_station = df['Start Station'].mode()[0]
-    popular_end_station = df['End Station'].mode()[0]
-
-    # Check for empty dataframe before attempting to group for combined trips
-    if not df.empty:
-        combo = df.groupby(['Start Station', 'End Station']).size().idxmax()
-        most_frequent_trip = f"{combo[0]} → {combo[1]}"
+    # Read the category codes once and derive all three results from them
+    start_categories = df['Start Station'].cat.categories
+    end_categories = df['End Station'].cat.categories
+    start_codes = df['Start Station'].cat.codes.values
+    end_codes = df['End Station'].cat.codes.values
+
+    # Missing stations are coded as -1, which _mode_small skips
+    popular_start_station = start_categories[_mode_small(start_codes)]
+    popular_end_station = end_categories[_mode_small(end_codes)]
+
+    # Encode each (start, end) pair as one integer key and count the keys
+    known_pairs = (start_codes >= 0) & (end_codes >= 0)
+    if known_pairs.any():
+        trip_keys = start_codes[known_pairs].astype(np.int64) * end_categories.size + end_codes[known_pairs]
+        start_code, end_code = divmod(int(_mode_small(trip_keys)), end_categories.size)
+        most_frequent_trip = f"{start_categories[start_code]} → {end_categories[end_code]}"
     else:
         most_frequent_trip = "N/A (No data for this filter combination)"
 
-
     data = {
         "Statistic": ["Most Popular Start Station", "Most Popular End Station", "Most Frequent Trip"],
         "Value": [popular_start_station, popular_end_station, most_frequent_trip]
     }
-    print(pd.DataFrame(data).to_markdown(index=False))
+    _print_table(data)
     print(f"\n(Calculated in {time.time() - start_time:.2f} seconds)")
     print('-'*50)
 
 
-def trip_duration_stats(df):
+def trip_duration_stats(df, stats=None):
     """
     Displays statistics on the total and average trip duration.
 
     Args:
         df (pandas.DataFrame): Filtered bikeshare data.
+        stats (dict): Result of _compute_all_stats(df); computed here if omitted.
     """
     print('\n🛣️ Trip Duration Stats:\n')
-    start_time = time.time()
 
     if df.empty:
         print("No data available for the selected filters to calculate trip duration statistics.")
         return
 
-    total_duration = int(np.sum(df['Trip Duration']))
-    avg_duration = int(np.mean(df['Trip Duration']))
+    if stats is None:
+        stats = _compute_all_stats(df)
+    # Count the shared computation in this section's reported time
+    start_time = time.time() - stats['calculation_time']
+
+    total_duration = stats['total_duration']
+    avg_duration = stats['avg_duration']
 
     # Convert total_duration to hours, minutes, seconds for better readability
     total_hours = total_duration // 3600
@@ -195,54 +585,65 @@ def trip_duration_stats(df):
             f"{avg_minutes} minutes, {avg_seconds} seconds"
         ]
     }
-    print(pd.DataFrame(data).to_markdown(index=False))
+    _print_table(data)
     print(f"\n(Calculated in {time.time() - start_time:.2f} seconds)")
     print('-'*50)
 
 
-def user_stats(df):
+def user_stats(df, stats=None):
     """
     Displays statistics on bikeshare users.
 
     Args:
         df (pandas.DataFrame): Filtered bikeshare data.
+        stats (dict): Result of _compute_all_stats(df); computed here if omitted.
     """
     print('\n👥 User Stats:\n')
-    start_time = time.time()
 
     if df.empty:
         print("No data available for the selected filters to calculate user statistics.")
         return
 
+    if stats is None:
+        stats = _compute_all_stats(df)
+    # Count the shared computation in this section's reported time
+    start_time = time.time() - stats['calculation_time']
+    counts = stats['counts']
+
     # Display counts of user types
-    user_type_counts = df['User Type'].value_counts()
-    user_type_data = [{"User Type": user_type, "Count": count} for user_type, count in user_type_counts.items()]
+    user_type_data = {"User Type": [value for value, _ in counts['User Type']],
+                      "Count": [count for _, count in counts['User Type']]}
     print("User Types:")
-    print(pd.DataFrame(user_type_data).to_markdown(index=False))
+    _print_table(user_type_data)
     print("\n")
 
     # Display gender distribution (if 'Gender' column exists)
     if 'Gender' in df.columns:
-        gender_counts = df['Gender'].value_counts()
-        gender_data = [{"Gender": gender, "Count": count} for gender, count in gender_counts.items()]
+        gender_data = {"Gender": [value for value, _ in counts['Gender']],
+                       "Count": [count for _, count in counts['Gender']]}
         print("Gender Distribution:")
-        print(pd.DataFrame(gender_data).to_markdown(index=False))
+        _print_table(gender_data)
         print("\n")
     else:
         print("Gender data not available for this city.\n")
 
     # Display birth year statistics (if 'Birth Year' column exists and has non-null values)
-    if 'Birth Year' in df.columns and not df['Birth Year'].isnull().all():
+    # One NaN mask and one offset bincount give min, max, and mode together
+    birth_years = df['Birth Year'].to_numpy() if 'Birth Year' in df.columns else np.empty(0)
+    known_years = birth_years[~np.isnan(birth_years)].astype(np.int32)
+    if known_years.size:
+        earliest_year = known_years.min()
+        year_counts = np.bincount(known_years - earliest_year)
         birth_year_data = {
             "Statistic": ["Earliest Birth Year", "Most Recent Birth Year", "Most Common Birth Year"],
             "Value": [
-                int(df['Birth Year'].min()),
-                int(df['Birth Year'].max()),
-                int(df['Birth Year'].mode()[0])
+                int(earliest_year),
+                int(earliest_year + year_counts.size - 1),
+                int(earliest_year + year_counts.argmax())
             ]
         }
         print("Birth Year Statistics:")
-        print(pd.DataFrame(birth_year_data).to_markdown(index=False))
+        _print_table(birth_year_data)
     else:
         print("Birth Year data not available for this city.\n")
 
@@ -261,89 +662,15 @@ def display_raw_data(df):
         print('-'*50)
         return
 
-=======
-def times_of_travel(df):
-        # Displays the most frequent month, day, and hour of travel
-    print("\n📅 Most Frequent Times of Travel")
-
-    popular_month = int(df['month'].mode()[0])
-    print(f"  Most Popular Month: {calendar.month_name[popular_month]}")
-
-    popular_day = df['day_of_week'].mode()[0].title()
-    print(f"  Most Popular Day: {popular_day}")
-
-    df['hour'] = df['Start Time'].dt.hour
-    popular_hour = int(df['hour'].mode()[0])
-    print(f"  Most Popular Start Hour: {popular_hour}:00")
-
-    print("-" * 50)
-
-
-def popular_stations(df):
-        # Identifies the most commonly used start station, end station, and trip combination
-    print("\n🚏 Most Popular Stations and Trip")
-
-    print(f"  Most Popular Start Station: {df['Start Station'].mode()[0]}")
-    print(f"  Most Popular End Station: {df['End Station'].mode()[0]}")
-
-    combo = df.groupby(['Start Station', 'End Station']).size().idxmax()
-    print(f"  Most Frequent Trip: {combo[0]} → {combo[1]}")
-
-    print("-" * 50)
-
-
-def trip_duration(df):
-              # Calculates and displays total and average trip durations
-    print("\n🛣️ Trip Duration Stats")
-
-    total_duration = int(np.sum(df['Trip Duration']))
-    avg_duration = int(np.mean(df['Trip Duration']))
-
-    print(f"  Total Trip Duration: {total_duration // 3600} hours, {(total_duration % 3600) // 60} minutes")
-    print(f"  Average Trip Duration: {avg_duration // 60} minutes")
-
-
-    print("-" * 50)
-
-
-def user_info(df):
-              # Displays counts of user types, gender distribution, and birth year statistics (if available)
-    print("\n👥 User Stats")
-
-    print("  User Types:")
-    for user_type, count in df['User Type'].value_counts().items():
-        print(f"    {user_type}: {count}")
-
-    if 'Gender' in df.columns:
-        print("\n  Gender Distribution:")
-        for gender, count in df['Gender'].value_counts().items():
-            print(f"    {gender}: {count}")
-
-    if 'Birth Year' in df.columns:
-        print("\n  Birth Year Statistics:")
-        print(f"    Earliest: {int(df['Birth Year'].min())}")
-        print(f"    Most Recent: {int(df['Birth Year'].max())}")
-        print(f"    Most Common: {int(df['Birth Year'].mode()[0])}")
-
-    print("-" * 50)
-
-def display_raw_data(df):
-    #Displays raw data 5 rows at a time upon user request
- main
     index = 0
     while True:
         show_data = input("Would you like to see 5 lines of raw data? Enter yes or no: ").strip().lower()
         if show_data == 'yes':
             if index < len(df):
-                # Using .to_markdown(index=False) for consistent table formatting
-                print(df.iloc[index:index+5].to_markdown(index=False))
+                # to_string skips tabulate's extra column-width pass of to_markdown
+                print(df.iloc[index:index+5].to_string(index=False))
                 index += 5
             else:
-
-            print(df.iloc[index:index+5])
-            index += 5
-            if index >= len(df):
-
                 print("No more data to display.")
                 break
         elif show_data == 'no':
@@ -354,28 +681,36 @@ def display_raw_data(df):
     print('-'*50)
 
 
-
 def main():
     while True:
         city, month, day = get_filters()
         df = load_data(city, month, day)
 
         # Offer to save the filtered data for external analysis (e.g., Tableau)
-        save_data_prompt = input("Do you want to save the filtered data to a CSV file for external analysis (e.g., Tableau)? (yes/no): ").strip().lower()
+        save_data_prompt = input("Do you want to save the filtered data to a file for external analysis (e.g., Tableau)? (yes/no): ").strip().lower()
         if save_data_prompt == 'yes':
-            output_filename = f"{city.replace(' ', '_')}_{month}_{day}_bikeshare_data.csv"
-            df.to_csv(output_filename, index=False)
-            print(f"\nFiltered data saved to '{output_filename}'. You can now use this file in Tableau or other tools.")
+            base_filename = f"{city.replace(' ', '_')}_{month}_{day}_bikeshare_data"
+            # Parquet is much faster to write than CSV; fall back to CSV without pyarrow
+            try:
+                output_filename = f"{base_filename}.parquet"
+                df.to_parquet(output_filename, engine='pyarrow', compression='snappy', index=False)
+                tool_hint = "Tableau can read it via the Tableau Parquet connector."
+            except ImportError:
+                output_filename = f"{base_filename}.csv"
+                df.to_csv(output_filename, index=False)
+                tool_hint = "You can now use this file in Tableau or other tools."
+            print(f"\nFiltered data saved to '{output_filename}'. {tool_hint}")
             print('-'*50)
         elif save_data_prompt != 'no':
             print("Invalid input. Skipping saving data.")
             print('-'*50)
 
-        # Proceed with displaying statistics
-        time_stats(df)
+        # Proceed with displaying statistics; the shared reductions run once
+        stats = _compute_all_stats(df)
+        time_stats(df, stats)
         station_stats(df)
-        trip_duration_stats(df)
-        user_stats(df)
+        trip_duration_stats(df, stats)
+        user_stats(df, stats)
         display_raw_data(df)
 
         restart = input('\nWould you like to restart the analysis? Enter yes or no.\n')
@@ -383,18 +718,5 @@ def main():
             break
 
 
-if __name__ == "__main__":
-    main()
-
-        city, month, day = search_by()
-        df = load_data(city, month, day)
-
-        times_of_travel(df)
-        trip_duration(df)
-        popular_stations(df)
-        user_info(df)
-        display_raw_data(df)
-
-
 if __name__ == "__main__":
     main()